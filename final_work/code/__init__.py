@@ -1,95 +1,463 @@
+import hashlib
+import math
+import mmap
 import os
+import pickle
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
+from scipy.sparse.csgraph import connected_components, laplacian, shortest_path
 import networkx as nx
-import matplotlib.pyplot as plt
-import statistics
-import pandas as pd
 
-def load_graphs_from_graph6_file(path):
+@dataclass
+class GraphContext:
+    """
+    Expensive per-graph intermediates, computed once and shared by every measure.
+    - nodes: node ids 0..n-1, which are also the rows/columns of A, L and D
+    - n_components: number of connected components
+    - labels: component label of each node (in the order of nodes)
+    - largest_idx: indices (into nodes) of the largest component
+    - A: sparse adjacency matrix (CSR)
+    - L: combinatorial Laplacian of A
+    - D: all-pairs shortest path lengths (hops, inf when unreachable)
+    """
+    nodes: np.ndarray
+    n_components: int
+    labels: np.ndarray
+    largest_idx: np.ndarray
+    A: scipy.sparse.csr_array
+    L: scipy.sparse.csr_array
+    D: np.ndarray
+
+    @property
+    def is_connected(self):
+        return self.n_components == 1
+
+    @cached_property
+    def distance_centralities(self):
+        """
+        (closeness, harmonic) arrays computed together in one pass over D:
+        the reciprocal distances give both the harmonic sums and the
+        reachability mask used by closeness.
+        """
+        n = len(self.nodes)
+        inverse = np.reciprocal(self.D, where=self.D > 0, out=np.zeros_like(self.D))
+        reached = inverse > 0
+        harmonic = inverse.sum(axis=1)
+        reachable = reached.sum(axis=1)
+        totsp = self.D.sum(axis=1, where=reached)
+        closeness = np.zeros(n)
+        mask = totsp > 0
+        closeness[mask] = reachable[mask] / totsp[mask] * reachable[mask] / (n - 1)
+        return closeness, harmonic
+
+def integer_labeled(G: nx.Graph) -> nx.Graph:
+    """
+    G with nodes relabelled 0..n-1 in node order; G itself when it already is
+    (always the case for graphs decoded from graph6/sparse6).
+    """
+    if all(v == i for i, v in enumerate(G)):
+        return G
+    return nx.convert_node_labels_to_integers(G, first_label=0, ordering="default")
+
+def build_graph_context(G: nx.Graph, A=None) -> GraphContext:
+    """
+    G must be labelled 0..n-1 (see integer_labeled), so node ids are matrix indices.
+    A: adjacency matrix of G, when it is already available (e.g. decoded
+    straight from graph6); built from G otherwise.
+    """
+    nodes = np.arange(G.number_of_nodes())
+    if A is None:
+        A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format="csr", dtype=np.float64)
+    # Components labelled in compiled code, without building a set per component
+    n_components, labels = connected_components(A, directed=False)
+    if labels.size:
+        largest_idx = np.flatnonzero(labels == np.bincount(labels).argmax())
+    else:
+        largest_idx = np.empty(0, dtype=np.intp)
+    L = laplacian(A)
+    D = shortest_path(A, method="D", unweighted=True, directed=False)
+    return GraphContext(nodes, n_components, labels, largest_idx, A, L, D)
+
+GRAPH6_HEADER = b">>graph6<<"
+SPARSE6_HEADER = b">>sparse6<<"
+SPARSE6_PREFIX = 0x3A  # b":"
+
+def read_graph6_lines(path):
     """
     Reads a .g6 file that can contain one or more graphs (one per line).
-    Returns a list of NetworkX graphs.
-    """
-    graphs = []
-    with open(path, "rb") as f:
-        for raw in f:
-            line = raw.strip()
-            if not line:
-                continue
-            # Ignores optional ">>graph6<<" header if it appears
-            if line == b">>graph6<<":
-                continue
-            # Graph6 typically starts without ":"; Sparse6 starts with ":".
-            if line.startswith(b":"):
-                # Sparse6 line
-                G = nx.from_sparse6_bytes(line)
-            else:
-                # Graph6 line
-                G = nx.from_graph6_bytes(line)
-            graphs.append(G)
-    return graphs
+    Returns the raw encoded line of each graph.
+    """
+    # mmap cannot map an empty file
+    if os.path.getsize(path) == 0:
+        return []
+    # Reads the whole file in a single pass and splits it at once
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[:]
+    # Strips surrounding whitespace and the optional header, which can open
+    # every graph (files written by nx.write_graph6 and concatenated) or stand
+    # on its own line; ignores the lines left empty
+    return [
+        line
+        for line in (
+            raw.strip().removeprefix(GRAPH6_HEADER).removeprefix(SPARSE6_HEADER)
+            for raw in data.splitlines()
+        )
+        if line
+    ]
+
+def decode_graph6_edges(line):
+    """
+    Decodes a graph6 line with NumPy: the 6-bit packed upper triangle is
+    unpacked in one call instead of bit by bit in Python.
+    Returns (n, i, j) with the edges (i, j), i < j, in graph6 bit order.
+    """
+    data = np.frombuffer(line, dtype=np.uint8).astype(np.int64) - 63
+    if np.any((data < 0) | (data > 63)):
+        raise ValueError("each input character must be in range(63, 127)")
+    # Number of nodes: 1, 4 or 8 bytes (see the graph6 format description)
+    if data[0] < 63:
+        n, offset = int(data[0]), 1
+    elif data[1] < 63:
+        n, offset = int(data[1]) << 12 | int(data[2]) << 6 | int(data[3]), 4
+    else:
+        n, offset = 0, 8
+        for d in data[2:8]:
+            n = n << 6 | int(d)
+    k = n * (n - 1) // 2
+    bits = np.unpackbits(data[offset:].astype(np.uint8)[:, None], axis=1)[:, 2:].ravel()
+    if bits.size < k:
+        raise ValueError(f"Expected {k} bits but got {bits.size} in graph6")
+    # Bit order is column by column: (0,1), (0,2), (1,2), (0,3), ...
+    j, i = np.tril_indices(n, -1)
+    mask = bits[:k].astype(bool)
+    return n, i[mask], j[mask]
+
+def adjacency_from_edges(n, i, j):
+    """Symmetric CSR adjacency matrix of the undirected edges (i, j)."""
+    rows = np.concatenate([i, j])
+    cols = np.concatenate([j, i])
+    data = np.ones(rows.size, dtype=np.float64)
+    return scipy.sparse.coo_array((data, (rows, cols)), shape=(n, n)).tocsr()
+
+def from_graph6_bytes_fast(line):
+    """
+    Decodes a graph6 line straight into a symmetric CSR adjacency matrix.
+    """
+    return adjacency_from_edges(*decode_graph6_edges(line))
+
+def graph_and_adjacency_from_line(line):
+    """
+    Decodes a graph6/sparse6 line into (graph, adjacency matrix).
+    Graph6 lines are decoded once with NumPy and feed both; for sparse6 the
+    matrix is None and is built later from the graph.
+    """
+    if line[0] == SPARSE6_PREFIX:
+        return nx.from_sparse6_bytes(line), None
+    n, i, j = decode_graph6_edges(line)
+    G = nx.empty_graph(n)
+    G.add_edges_from(zip(i.tolist(), j.tolist()))
+    return G, adjacency_from_edges(n, i, j)
+
+# Layouts already computed in this process, keyed by (n, edge set), oldest first
+_layout_cache = OrderedDict()
+LAYOUT_CACHE_SIZE = 256
+
+def graph_layout(G):
+    """
+    Node positions for plotting: Kamada-Kawai for small graphs (<= 50 nodes),
+    spectral layout (Laplacian eigenvectors, ARPACK on large graphs) otherwise.
+    Both avoid the O(iter * N^2) Python loop of spring_layout.
+    Kamada-Kawai starts from the spectral layout of connected graphs, which is
+    deterministic and already close to the optimum, so it converges faster.
+    Results are cached (LRU) for graphs with the same nodes and edges.
+    """
+    key = (G.number_of_nodes(), frozenset(G.edges()))
+    if key in _layout_cache:
+        _layout_cache.move_to_end(key)
+        return _layout_cache[key]
+    if G.number_of_nodes() <= 50:
+        # Disconnected graphs collapse components onto a point in the spectral
+        # layout, which Kamada-Kawai cannot start from: use its default instead
+        seeded = G.number_of_nodes() > 0 and nx.is_connected(G)
+        pos = nx.kamada_kawai_layout(G, pos=nx.spectral_layout(G) if seeded else None)
+    else:
+        pos = nx.spectral_layout(G)
+    _layout_cache[key] = pos
+    if len(_layout_cache) > LAYOUT_CACHE_SIZE:
+        _layout_cache.popitem(last=False)
+    return pos
+
+_figures = {}
+
+def get_figure(kind):
+    """
+    Figure reused by every plot of the same kind (one canvas per process)
+    instead of creating and closing a figure per graph.
+    """
+    if kind not in _figures:
+        # matplotlib is imported on the first plot only: analysis-only runs
+        # (and worker processes) skip its font/backend initialization
+        import matplotlib
+        matplotlib.use("Agg")  # headless: plots are only saved to files
+        import matplotlib.pyplot as plt
+        plt.rcParams["path.simplify_threshold"] = 1.0
+        _figures[kind] = plt.subplots(figsize=(6, 6))
+    return _figures[kind]
+
+def preload_plotting():
+    """
+    Imports matplotlib and resolves the default font up front, so the first
+    graph of each worker does not pay for the font manager.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib import font_manager
+    font_manager.findfont(font_manager.FontProperties())
+
+def init_worker(visualize):
+    """
+    Initializer of the pool workers. The pool already uses every core, so
+    nx-parallel is pinned to one job per worker: otherwise each worker would
+    start its own joblib pool, up to cpu_count**2 busy processes.
+    """
+    parallel_config = getattr(nx.config.backends, "parallel", None)
+    if parallel_config is not None:
+        # nx-parallel 0.3 reads n_jobs from this config only while it is active
+        if hasattr(parallel_config, "active"):
+            parallel_config.active = True
+        parallel_config.n_jobs = 1
+    if visualize:
+        preload_plotting()
 
 def visualize_graph(G, title="Graph Visualization", file_name="graph.png"):
-    plt.figure(figsize=(6, 6))
-    pos = nx.spring_layout(G, seed=42)
+    fig, ax = get_figure("graph")
+    from matplotlib.collections import LineCollection
+    ax.clear()
+    pos = graph_layout(G)
     
-    nx.draw(
-        G, pos,
-        with_labels=True,
-        node_color="lightblue",
-        node_size=800,
-        font_size=10,
-        font_weight="bold",
-        edge_color="gray"
-    )
+    # Edges as one LineCollection and nodes as one scatter, instead of nx.draw
+    segments = [(pos[u], pos[v]) for u, v in G.edges()]
+    ax.add_collection(LineCollection(segments, colors="gray", zorder=1))
+    xy = np.array([pos[v] for v in G]).reshape(-1, 2)
+    ax.scatter(xy[:, 0], xy[:, 1], s=800, c="lightblue", zorder=2)
+    # Labels only when they are readable
+    if G.number_of_nodes() <= 50:
+        nx.draw_networkx_labels(G, pos, ax=ax, font_size=10, font_weight="bold")
+    ax.set_axis_off()
     
-    plt.title(title, fontsize=14)
-    plt.savefig(file_name)   # save instead of show
-    plt.close()              # close the figure so nothing opens
+    ax.set_title(title, fontsize=14)
+    fig.savefig(file_name, dpi=72)   # save instead of show
 
-def plot_adjacency_matrix(G: nx.Graph, title: str = "Adjacency Matrix", file_name="adjacency_matrix.png"):
+def plot_adjacency_matrix(G: nx.Graph, title: str = "Adjacency Matrix", file_name="adjacency_matrix.png", A=None):
     """
     Exibe a matriz de adjacência do grafo como um heatmap.
     - Mostra rótulos de nós quando o grafo é pequeno (<= 20 nós).
-    - Abre a janela de plot (plt.show()).
+    - Nós na ordem de G.nodes() (0..n-1 nos grafos lidos de graph6).
+    - A: matriz esparsa já calculada, na mesma ordem (opcional).
+    - Grafos com menos de 2 nós não são plotados (a imagem ficaria degenerada).
     """
-    # Define ordem estável de nós (tenta ordenar caso comparáveis)
     nodes = list(G.nodes())
-    try:
-        nodes = sorted(nodes)
-    except Exception:
-        pass
-
-    A = nx.to_numpy_array(G, nodelist=nodes, dtype=float)
-
-    plt.figure(figsize=(6, 6))
-    im = plt.imshow(A, cmap="Blues", interpolation="nearest")
-    plt.title(title, fontsize=14)
-    plt.xlabel("Nodes")
-    plt.ylabel("Nodes")
+    # A 0x0/1x1 image gives identical axis limits (and an empty color range)
+    if len(nodes) < 2:
+        print(f"Skipping adjacency plot of {file_name}: fewer than 2 nodes")
+        return
+    if A is not None:
+        A = A.toarray()
+    else:
+        A = nx.to_numpy_array(G, nodelist=nodes, dtype=float)
 
+    fig, ax = get_figure("adjacency")
     n = len(nodes)
+    if not ax.images:
+        # First plot: creates the image and its colorbar once
+        im = ax.imshow(A, cmap="Blues", interpolation="nearest")
+        fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+        ax.set_xlabel("Nodes")
+        ax.set_ylabel("Nodes")
+        fig.tight_layout()
+    else:
+        # Next plots: only swap the data of the existing image
+        im = ax.images[0]
+        im.set_data(A)
+        im.set_extent((-0.5, n - 0.5, n - 0.5, -0.5))
+        im.set_clim(A.min(), A.max())
+    ax.set_title(title, fontsize=14)
+
     if n <= 20:
-        plt.xticks(range(n), nodes, rotation=90)
-        plt.yticks(range(n), nodes)
+        ax.set_xticks(range(n), nodes, rotation=90)
+        ax.set_yticks(range(n), nodes)
     else:
-        plt.xticks([])
-        plt.yticks([])
+        ax.set_xticks([])
+        ax.set_yticks([])
+
+    fig.savefig(file_name, dpi=72)   # save instead of show
+
+def closeness_from_distances(G: nx.Graph, context: GraphContext):
+    """Closeness centrality (Wasserman-Faust normalization, as NetworkX) from the APSP matrix."""
+    closeness, _ = context.distance_centralities
+    return dict(zip(context.nodes.tolist(), closeness.tolist()))
+
+def harmonic_from_distances(G: nx.Graph, context: GraphContext):
+    """Harmonic centrality (sum of 1/d over the other nodes) from the APSP matrix."""
+    _, harmonic = context.distance_centralities
+    return dict(zip(context.nodes.tolist(), harmonic.tolist()))
+
+def algebraic_connectivity_from_laplacian(G: nx.Graph, context: GraphContext):
+    """
+    Second smallest eigenvalue of the Laplacian, via LOBPCG restricted to the
+    complement of the constant null vector (dense solver on tiny graphs).
+    If LOBPCG does not converge, shift-invert eigsh is used instead.
+    """
+    # Disconnected graphs have a repeated zero eigenvalue
+    if not context.is_connected:
+        return 0.0
+    L = context.L.astype(np.float64)
+    n = L.shape[0]
+    # LOBPCG needs the constrained problem to be several times larger than the block size
+    if n < 20:
+        return float(np.linalg.eigvalsh(L.toarray())[1])
+    X = np.random.default_rng(42).standard_normal((n, 2))
+    Y = np.ones((n, 1))  # constraint: search orthogonal to the constant vector
+    M = scipy.sparse.diags(1.0 / L.diagonal())  # Jacobi preconditioner
+    with warnings.catch_warnings():
+        # Non-convergence is detected from the residual below
+        warnings.simplefilter("ignore", UserWarning)
+        vals, vecs = scipy.sparse.linalg.lobpcg(L, X, M=M, Y=Y, largest=False, tol=1e-8, maxiter=500)
+    k = np.argmin(vals)
+    value, v = vals[k], vecs[:, k]
+    residual = np.linalg.norm(L @ v - value * v) / np.linalg.norm(v)
+    if residual <= 1e-6 * max(1.0, abs(value)):
+        return float(value)
+    # Not converged: with a small negative shift the two nearest eigenvalues are 0 and lambda_2
+    vals = scipy.sparse.linalg.eigsh(L.tocsc(), k=2, sigma=-1e-3, which="LM", return_eigenvectors=False)
+    return float(np.sort(vals)[1])
+
+def average_shortest_path_from_distances(G: nx.Graph, context: GraphContext):
+    """Mean distance over all ordered pairs of distinct nodes (graph must be connected)."""
+    if not context.is_connected:
+        raise nx.NetworkXError("Graph is not connected.")
+    n = len(context.nodes)
+    # A single node has no pairs (NetworkX returns 0)
+    if n < 2:
+        return 0.0
+    return float(context.D.sum() / (n * (n - 1)))
 
-    plt.colorbar(im, fraction=0.046, pad=0.04)
-    plt.tight_layout()
-    plt.savefig(file_name)   # save instead of show
-    plt.close()              # close the figure so nothing opens
+def eigenvector_from_adjacency(G: nx.Graph, context: GraphContext):
+    """
+    Eigenvector centrality via ARPACK (Lanczos) on the sparse adjacency matrix.
+    Starts from the all-ones vector, like NetworkX's power iteration, so graphs
+    whose top eigenvalue repeats get a deterministic, symmetric result.
+    """
+    n = len(context.nodes)
+    # No edges: every node is equivalent (NetworkX returns 1/sqrt(n))
+    if context.A.nnz == 0:
+        return dict.fromkeys(context.nodes.tolist(), 1 / np.sqrt(n)) if n else {}
+    _, vecs = scipy.sparse.linalg.eigsh(context.A, k=1, which="LA", v0=np.ones(n), maxiter=5000, tol=1e-6)
+    v = np.abs(vecs[:, 0])
+    v /= np.linalg.norm(v)
+    return dict(zip(context.nodes.tolist(), v.tolist()))
+
+def preferred_backend():
+    """
+    Installed NetworkX dispatch backend to use for the heavy traversals:
+    cugraph (GPU) first, then nx-parallel; None keeps the default implementation.
+    """
+    for name in ("cugraph", "parallel"):
+        if name in nx.utils.backends.backends:
+            return name
+    return None
+
+# Graphs above this size get sampled (approximate) betweenness
+BETWEENNESS_EXACT_MAX_NODES = 1000
+
+def betweenness_pivots(n):
+    """
+    Number of pivot sources sampled for betweenness (Brandes-Pich) on n nodes:
+    None (exact, all sources) up to BETWEENNESS_EXACT_MAX_NODES, then
+    max(50, sqrt(n)). The standard error is ~1/sqrt(k) relative to the maximum
+    value, for O(k * E) work instead of O(N * E).
+    """
+    if n <= BETWEENNESS_EXACT_MAX_NODES:
+        return None
+    return min(n, max(50, math.isqrt(n)))
 
-def calculate_centralities(G: nx.Graph, measures: dict):
+def betweenness_with_backend(G: nx.Graph):
+    """
+    Brandes betweenness centrality dispatched to the preferred backend,
+    sampling betweenness_pivots(n) sources on large graphs.
+    On nx-parallel, large graphs also split the source nodes into smaller
+    chunks to cap the peak memory of each job (one job per pool worker, see
+    init_worker).
+    """
+    n = G.number_of_nodes()
+    kwargs = {"k": betweenness_pivots(n), "seed": 42}
+    backend = preferred_backend()
+    if backend is None:
+        return nx.betweenness_centrality(G, **kwargs)
+    if backend == "parallel" and n > BETWEENNESS_EXACT_MAX_NODES:
+        chunk_size = max(1, n // (4 * (os.cpu_count() or 1)))
+        kwargs["get_chunks"] = lambda nodes: chunk_nodes(nodes, chunk_size)
+    try:
+        return nx.betweenness_centrality(G, backend=backend, **kwargs)
+    except ImportError as e:
+        # Backend installed but incompatible with this NetworkX version
+        print(f"Backend {backend} unavailable ({e}); using NetworkX betweenness.")
+        kwargs.pop("get_chunks", None)
+        return nx.betweenness_centrality(G, **kwargs)
+
+def chunk_nodes(nodes, chunk_size):
+    nodes = list(nodes)
+    return [nodes[i:i + chunk_size] for i in range(0, len(nodes), chunk_size)]
+
+# Labels whose functions take the precomputed GraphContext as second argument
+CONTEXT_MEASURES = {
+    "Closeness",
+    "Eigenvector",
+    "Harmonic Centrality",
+    "Algebraic Connectivity",
+    "Average Shortest Path Length",
+}
+
+# Measures that raise (after running for a while) on disconnected graphs;
+# they are recorded as NaN when skipped
+REQUIRES_CONNECTED = {
+    "Current-flow Betweenness",
+    "Average Shortest Path Length",
+    "Minimum Node Cut",
+    "Minimum Edge Cut",
+}
+
+# Summary statistics of the per-node measures, in the column order of the stats array
+STAT_NAMES = ("Average", "Minimum", "Maximum", "Standard Deviation")
+
+def calculate_centralities(G: nx.Graph, measures: dict, context: GraphContext):
     """
     Apply a set of measures (centralities/connectivities) to a graph.
     measures: dict {label: function}
+    context: precomputed GraphContext of G, reused by the distance/spectral measures
+    Returns (stats, values):
+    - stats: array (len(measures), len(STAT_NAMES)) with the summary statistics
+      of the per-node measures, one row per measure (NaN if not per-node or failed)
+    - values: dict {label: value} of the single-valued measures
     """
-    results = {}
-    for label, func in measures.items():
+    stats = np.full((len(measures), len(STAT_NAMES)), np.nan)
+    values = {}
+    for row, (label, func) in enumerate(measures.items()):
+        # Connectivity is known from the context: skip instead of failing midway
+        if label in REQUIRES_CONNECTED and not context.is_connected:
+            print(f"\n>>> {label}: skipped (graph is not connected)")
+            values[label] = np.nan
+            continue
         try:
-            if label == "Algebraic Connectivity":
-                result = func(G, method="lanczos") #"tracemin"
+            # Measures derived from the shared adjacency / APSP matrix / Laplacian
+            if label in CONTEXT_MEASURES:
+                result = func(G, context)
             # Some functions require parameters (like Katz centrality)
             elif label == "Katz Centrality":
                 result = func(G, alpha=0.005, beta=1.0, max_iter=2000)
@@ -102,102 +470,213 @@ def calculate_centralities(G: nx.Graph, measures: dict):
             # If result is a dict (per-node values)
             if isinstance(result, dict):
                 # Calculate summary statistics
-                values = list(result.values())
-                average_value = sum(values) / len(values)
-                min_value = min(values)
-                max_value = max(values)
-                std_dev = statistics.pstdev(values)  # desvio padrão populacional
+                arr = np.fromiter(result.values(), dtype=np.float64, count=len(result))
+                stats[row] = (
+                    arr.mean(dtype=np.float64),
+                    arr.min(),
+                    arr.max(),
+                    arr.std(dtype=np.float64),  # desvio padrão populacional
+                )
                 
                 # Print results
-                results[label] = {
-                    "Average": average_value,
-                    "Minimum": min_value,
-                    "Maximum": max_value,
-                    "Standard Deviation": std_dev
-                }
-                print(f"Average_{label}: {average_value:.4f}")
-                print(f"Minimum_{label}: {min_value:.4f}")
-                print(f"Maximum_{label}: {max_value:.4f}")
-                print(f"Standard_Deviation_{label}: {std_dev:.4f}")
+                for stat, value in zip(STAT_NAMES, stats[row]):
+                    print(f"{stat.replace(' ', '_')}_{label}: {value:.4f}")
 
             else:
                 # Single numeric value
                 print(f"Value: {result}")
-                results[label] = result
+                values[label] = result
                 
         except Exception as e:
             print(f"Error computing {label}: {e}")
-    return results
+            values[label] = np.nan
+    return stats, values
 
-def evaluate_connectivity(G):
+def evaluate_connectivity(G, context: GraphContext):
     """
     Evaluate basic connectivity measures of a graph.
     
     Parameters:
     - G: NetworkX graph
+    - context: precomputed GraphContext of G
     
     Returns:
     - dictionary with:
         * number of connected components
         * size of the largest connected component
-        * diameter of the graph (largest component)
+        * diameter, radius and center of the graph (largest component)
     """
     # Number of connected components
-    num_components = nx.number_connected_components(G)
+    num_components = context.n_components
     
     # Largest connected component
-    components = list(nx.connected_components(G))
-    largest_component = max(components, key=len)
-    largest_size = len(largest_component)
-    
-    # Subgraph induced by the largest component
-    largest_subgraph = G.subgraph(largest_component)
+    largest_idx = context.largest_idx
+    largest_size = len(largest_idx)
     
-    # Diameter of the largest component
-    diameter = nx.diameter(largest_subgraph)
+    # Eccentricities of the largest component, read from the shared APSP matrix
+    eccentricity = context.D[np.ix_(largest_idx, largest_idx)].max(axis=1)
+    diameter = int(eccentricity.max())
+    radius = int(eccentricity.min())
+    center = set(context.nodes[largest_idx[eccentricity == radius]].tolist())
     
     result = {
         "Number of connected components": num_components,
         "Size of largest component": largest_size,
-        "Graph diameter": diameter
+        "Graph diameter": diameter,
+        "Graph radius": radius,
+        "Graph center": center
     }
     print("\n>>> Connectivity Measures:")
     for key, value in result.items():
         print(f"{key}: {value}")
     return result
 
-def main(folder: str):
-    # Dictionary to store the loaded graphs
-    graphs = {}
-
-    dict_centralities = {
-        #Standard centrality measures
-        "Degree": nx.degree_centrality,
-        "Closeness": nx.closeness_centrality,
-        "Betweenness": nx.betweenness_centrality,
-        "Eigenvector": nx.eigenvector_centrality,
-        
-        # Additional centrality measures
-        "Katz Centrality": nx.katz_centrality,
-        "PageRank": nx.pagerank,
-        "Harmonic Centrality": nx.harmonic_centrality,
-        "Current-flow Betweenness": nx.current_flow_betweenness_centrality
-    }
-    dict_connectivity = {
-        #Standard connectivity measures
-        "Node Connectivity": nx.node_connectivity,
-        "Edge Connectivity": nx.edge_connectivity,
-        "Algebraic Connectivity": nx.algebraic_connectivity,
-
-        # Additional connectivity measures
-        "Average Node Connectivity": nx.average_node_connectivity,
-        "Graph Density": nx.density,  # razão entre arestas existentes e possíveis
-        "Average Shortest Path Length": nx.average_shortest_path_length,  # eficiência global
-        "Global Clustering Coefficient": nx.transitivity,  # tendência de formar triângulos
-        "Minimum Node Cut": nx.minimum_node_cut,  # conjunto mínimo de vértices críticos
-        "Minimum Edge Cut": nx.minimum_edge_cut   # conjunto mínimo de arestas críticas
+dict_centralities = {
+    #Standard centrality measures
+    "Degree": nx.degree_centrality,
+    "Closeness": closeness_from_distances,
+    "Betweenness": betweenness_with_backend,
+    "Eigenvector": eigenvector_from_adjacency,
+    
+    # Additional centrality measures
+    "Katz Centrality": nx.katz_centrality,
+    "PageRank": nx.pagerank,
+    "Harmonic Centrality": harmonic_from_distances,
+    "Current-flow Betweenness": nx.current_flow_betweenness_centrality
+}
+dict_connectivity = {
+    #Standard connectivity measures
+    "Node Connectivity": nx.node_connectivity,
+    "Edge Connectivity": nx.edge_connectivity,
+    "Algebraic Connectivity": algebraic_connectivity_from_laplacian,
+
+    # Additional connectivity measures
+    "Average Node Connectivity": nx.average_node_connectivity,
+    "Graph Density": nx.density,  # razão entre arestas existentes e possíveis
+    "Average Shortest Path Length": average_shortest_path_from_distances,  # eficiência global
+    "Global Clustering Coefficient": nx.transitivity,  # tendência de formar triângulos
+    "Minimum Node Cut": nx.minimum_node_cut,  # conjunto mínimo de vértices críticos
+    "Minimum Edge Cut": nx.minimum_edge_cut   # conjunto mínimo de arestas críticas
+}
+
+# Row columns of the centrality stats array, flattened measure by measure
+CENTRALITY_COLUMNS = [f"Centrality_{label}_{stat}" for label in dict_centralities for stat in STAT_NAMES]
+
+def plot_graph_images(G, A, file, i):
+    #! A) Graph visualization
+    visualize_graph(G, title=f"{file} - graph {i}", file_name=f"graph_{file}_graph_{i}.png")
+    #! A2) Adjacency matrix
+    plot_adjacency_matrix(G, title=f"Adjacency Matrix - {file} - graph {i}", file_name=f"adjacency_{file}_graph_{i}.png", A=A)
+
+def plot_graph(args):
+    """
+    Only plots one graph, whose measures are reused from the cache or from
+    an identical graph. Executed inside worker processes, like analyze_graph.
+    args: (file, i, line, visualize)
+    """
+    file, i, line, _ = args
+    try:
+        G, A = graph_and_adjacency_from_line(line)
+        plot_graph_images(integer_labeled(G), A, file, i)
+    except Exception as e:
+        print(f"Failed to plot graph {i} of {file}: {e}")
+
+def analyze_graph(args):
+    """
+    Runs the full analysis of one graph. Executed inside worker processes,
+    so it receives the raw graph6 line instead of a NetworkX graph.
+    args: (file, i, line, visualize)
+    Returns the DataFrame row of the graph, or None if it cannot be decoded or analyzed.
+    """
+    file, i, line, visualize = args
+    # Any failure only loses this graph, never the whole run
+    try:
+        G, A = graph_and_adjacency_from_line(line)
+        G = integer_labeled(G)
+        context = build_graph_context(G, A)
+        if visualize:
+            plot_graph_images(G, context.A, file, i)
+        #! B) Centrality calculations
+        centrality_stats, _ = calculate_centralities(G, dict_centralities, context)
+        #! C) Connectivity evaluation
+        dict_evaluate = evaluate_connectivity(G, context)
+        #! C2) Algebraic connectivity
+        _, connectivity_values = calculate_centralities(G, dict_connectivity, context)
+    except Exception as e:
+        print(f"Failed to analyze graph {i} of {file}: {e}")
+        return None
+
+    return {
+        "File": file,
+        "Graph_Index": i,
+        "Num_Nodes": G.number_of_nodes(),
+        "Num_Edges": G.number_of_edges(),
+        **dict(zip(CENTRALITY_COLUMNS, centrality_stats.ravel().tolist())),
+        **{f"Connectivity_{k}_Value": v for k, v in connectivity_values.items()},
+        **dict_evaluate
     }
-    results_df = pd.DataFrame()
+
+def save_results(results_df, output_file):
+    """
+    Saves the results table as Parquet (columnar, compressed).
+    Falls back to CSV when no Parquet engine (pyarrow/fastparquet) is installed.
+    Set-valued columns (cuts, center) are stored as text, as in the CSV.
+    """
+    object_columns = results_df.select_dtypes(include="object").columns
+    table = results_df.astype({c: str for c in object_columns})
+    try:
+        table.to_parquet(output_file)
+    except ImportError:
+        output_file = os.path.splitext(output_file)[0] + ".csv"
+        table.to_csv(output_file, index=False)
+    print(f"Results saved to {output_file}")
+
+def graph_cache_key(line):
+    """Hash of the encoded graph, identifying literal duplicates across files and runs."""
+    return hashlib.blake2b(line, digest_size=16).digest()
+
+# Version of what the measures compute and of the row layout: bump it whenever
+# either changes, so rows cached by older code are discarded
+RESULTS_SCHEMA_VERSION = 3
+
+def cache_signature():
+    # Cached rows are only valid for the code and measure set that produced them
+    return (RESULTS_SCHEMA_VERSION, tuple(dict_centralities), tuple(dict_connectivity))
+
+def load_cache(cache_file):
+    """
+    Loads the per-graph results cache {key: row} pickled by a previous run.
+    Returns an empty cache if there is none or if the measures/schema changed.
+    """
+    if cache_file is None or not os.path.exists(cache_file):
+        return {}
+    try:
+        with open(cache_file, "rb") as f:
+            cache = pickle.load(f)
+    except Exception as e:
+        print(f"Ignoring unreadable cache {cache_file}: {e}")
+        return {}
+    if cache.get("signature") != cache_signature():
+        return {}
+    return cache["rows"]
+
+def save_cache(cache_file, rows):
+    if cache_file is None:
+        return
+    with open(cache_file, "wb") as f:
+        pickle.dump({"signature": cache_signature(), "rows": rows}, f)
+
+def main(folder: str, output_file: str = "results.parquet", visualize: bool = False,
+         cache_file: str = None):
+    """
+    Analyzes every graph of the .g6 files in folder and saves the results table.
+    Graphs repeated in the folder (same encoding) are analyzed once. With a
+    cache_file (e.g. ".centrality_cache.pkl"), results are also kept across
+    runs; it is a pickle, so only point it at files you trust.
+    With visualize, every graph is plotted, including repeated/cached ones.
+    """
+    # Raw graph lines to analyze: (file, graph index, graph6 bytes, plot flag)
+    tasks = []
 
     # Iterates through all files in the folder
     for file in os.listdir(folder):
@@ -205,42 +684,53 @@ def main(folder: str):
             file_path = os.path.join(folder, file)
             print(f"\nProcessing file: {file}")
             try:
-                graph_list = load_graphs_from_graph6_file(file_path)
-                graphs[file] = graph_list
-                
-                for i, G in enumerate(graph_list):
-                    #! A) Graph visualization
-                    visualize_graph(G, title=f"{file} - graph {i}", file_name=f"graph_{file}_graph_{i}.png")
-                    #! A2) Adjacency matrix
-                    plot_adjacency_matrix(G, title=f"Adjacency Matrix - {file} - graph {i}", file_name=f"adjacency_{file}_graph_{i}.png")
-                    #! B) Centrality calculations
-                    # results_centralities = calculate_centralities(G, dict_centralities)
-                    #! C) Connectivity evaluation
-                    # dict_evaluate = evaluate_connectivity(G)
-                    #! C2) Algebraic connectivity
-                    results_connectivity = calculate_centralities(G, dict_connectivity)
-
-                    new_row = {
-                        "File": file,
-                        "Graph_Index": i,
-                        "Num_Nodes": G.number_of_nodes(),
-                        "Num_Edges": G.number_of_edges(),
-                        **{f"Centrality_{k}_{stat}": v for k, stats in results_centralities.items() for stat, v in stats.items()},
-                        **{f"Connectivity_{k}_{stat}": v for k, stats in results_connectivity.items() for stat, v in stats.items()},
-                        **{k: v for k, v in dict_evaluate.items()}
-                    }
-                    results_df = pd.concat([results_df, pd.DataFrame([new_row])], ignore_index=True)
-
+                tasks.extend((file, i, line, visualize) for i, line in enumerate(read_graph6_lines(file_path)))
             except Exception as e:
                 print(f"Failed to read {file}: {e}")
 
-            print(f"\n>>> Finished processing {file}.")
+    # Only graphs missing from the cache are analyzed, each one once
+    cache = load_cache(cache_file)
+    keys = [graph_cache_key(line) for _, _, line, _ in tasks]
+    pending = {}
+    for key, task in zip(keys, tasks):
+        if key not in cache and key not in pending:
+            pending[key] = task
+
+    # Graphs whose measures are reused still need their own plots
+    plot_only = []
+    if visualize:
+        plot_only = [task for key, task in zip(keys, tasks) if pending.get(key) is not task]
+
+    # Graphs are independent: analyze them in parallel across worker processes
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(pending) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(visualize,)) as ex:
+        for key, row in zip(pending, ex.map(analyze_graph, pending.values(), chunksize=chunksize)):
+            if row is not None:
+                cache[key] = {k: v for k, v in row.items() if k not in ("File", "Graph_Index")}
+        list(ex.map(plot_graph, plot_only, chunksize=max(1, len(plot_only) // (4 * workers))))
+    save_cache(cache_file, cache)
+
+    rows = []
+    for key, (file, i, _, _) in zip(keys, tasks):
+        if key in cache:
+            rows.append({"File": file, "Graph_Index": i, **cache[key]})
+    if not rows:
+        print("No graphs to report.")
+        return None
+
+    # Builds the table once instead of concatenating a frame per graph
+    import pandas as pd
+    results_df = pd.DataFrame.from_records(rows)
+    save_results(results_df, output_file)
 
     # Display the loaded graphs information
-    for name, graph_list in graphs.items():
-        total_nodes = sum(G.number_of_nodes() for G in graph_list)
-        total_edges = sum(G.number_of_edges() for G in graph_list)
+    for name, graph_rows in results_df.groupby("File", sort=False):
+        total_nodes = graph_rows["Num_Nodes"].sum()
+        total_edges = graph_rows["Num_Edges"].sum()
         print(f"{name}: {total_nodes} nodes, {total_edges} edges")
 
+    return results_df
+
 if __name__ == "__main__":
-    main(folder=os.path.join("final_work", "data_base"))
\ No newline at end of file
+    main(folder=os.path.join("final_work", "data_base"), cache_file=".centrality_cache.pkl")